@@ -1,4 +1,6 @@
-from typing import Iterator, Union, List
+import functools
+import operator
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Union
 from typing import Tuple
 
 
@@ -32,6 +34,11 @@ class Version:
     >>> sorted(versionslist, reverse=True)
     [Version(2024, 2, 25, 101), Version(1, 0, 1), Version(1, 0, 0, 0), Version(1, 0, 0), Version(0, 9, 95), Version(0, 8, 97)]
 
+    For large lists, `sort_versions()` gives the same order without going through comparison operators:
+
+    >>> sort_versions(versionslist) == sorted(versionslist)
+    True
+
 
     Some possible Edge cases tests:
 
@@ -71,34 +78,110 @@ class Version:
     '-3.5.-99'
     """
 
+    __slots__ = (
+        "__version_parts",
+        "_str_cache",
+        "_repr_cache",
+        "_hash_cache",
+        "__weakref__",
+    )
+
+    _str_cache: str
+    _repr_cache: str
+    _hash_cache: int
+
+    # C-level getter, not the parts themselves: `Version._parts_key(v)` returns the parts
+    # tuple of `v`, used as sort key by `sort_versions()`
+    _parts_key = operator.attrgetter("_Version__version_parts")
+
     def __init__(self, *args: int) -> None:
-        """Constructor
+        """Constructor, fills out all version parts into class' internal tuple
 
         >>> v = Version(2023, 3, 5)
         >>> v
         Version(2023, 3, 5)
-        """
-        self.__fill_parts(*args)
-
-    def __fill_parts(self, *args: int) -> None:
-        """
-        Fills out all version parts into class' internal tuple
-
+        >>> hasattr(v, "__dict__")
+        False
+        >>> import weakref
+        >>> weakref.ref(v)() is v
+        True
         >>> v = Version("a", 3, 4)  # doctest: +ELLIPSIS
         Traceback (most recent call last):
             ...
         TypeError: Parts of semantic version must be all integer, 'a' passed
+
+        Only exact `int` is accepted, subclasses like `bool` are rejected:
+
+        >>> v = Version(True, 1)  # doctest: +ELLIPSIS
+        Traceback (most recent call last):
+            ...
+        TypeError: Parts of semantic version must be all integer, True passed
+        >>> import enum
+        >>> class Level(enum.IntEnum):
+        ...     A = 1
+        >>> v = Version(Level.A, 0)  # doctest: +ELLIPSIS
+        Traceback (most recent call last):
+            ...
+        TypeError: Parts of semantic version must be all integer, <Level.A: 1> passed
+
+        Other integer-like values can be converted explicitly with `int(operator.index(part))`:
+
+        >>> Version(*[int(operator.index(part)) for part in (True, 1)])
+        Version(1, 1)
         """
-        __version_parts: List[int] = []
         for part in args:
-            if not isinstance(part, int):
+            if type(part) is not int:  # noqa: E721
                 raise TypeError(
-                    f"Parts of semantic version must be all integer, '{part}' passed"
+                    f"Parts of semantic version must be all integer, {part!r} passed"
                 )
-            __version_parts.append(part)
-        self.__version_parts: Tuple[int, ...] = tuple(__version_parts)
+        self.__version_parts: Tuple[int, ...] = args
+
+    @classmethod
+    def _from_parts(cls, parts: Tuple[int, ...]) -> "Version":
+        """
+        Creates version directly from tuple of already validated integer parts,
+        skipping the type checks done by the constructor
+
+        >>> Version._from_parts((2023, 3, 5))
+        Version(2023, 3, 5)
+        """
+        version: "Version" = cls.__new__(cls)
+        version.__version_parts = parts
+        return version
+
+    def __reduce__(self) -> Tuple[
+        Callable[[Tuple[int, ...]], "Version"],
+        Tuple[Tuple[int, ...]],
+        Optional[Dict[str, Any]],
+    ]:
+        """Pickle support, version is rebuilt from its class and parts only
+
+        >>> import pickle
+        >>> pickle.loads(pickle.dumps(Version(1, 2), 0))
+        Version(1, 2)
+        >>> pickle.loads(pickle.dumps(Version(2023, 3, 5)))
+        Version(2023, 3, 5)
+
+        Subclasses keep their type and instance `__dict__`:
+
+        >>> import copy
+        >>> class TaggedVersion(Version):
+        ...     pass
+        >>> v = TaggedVersion(1, 2, 3)
+        >>> v.tag = "x"
+        >>> for w in (copy.copy(v), copy.deepcopy(v)):
+        ...     print(type(w).__name__, w.tag, w == v)
+        TaggedVersion x True
+        TaggedVersion x True
+        """
+        return (
+            type(self)._from_parts,
+            (self.__version_parts,),
+            getattr(self, "__dict__", None),
+        )
 
     @staticmethod
+    @functools.lru_cache(maxsize=4096)
     def from_string(version: str) -> "Version":
         """Create semantic version directly from the string
 
@@ -109,9 +192,20 @@ class Version:
         Traceback (most recent call last):
             ...
         ValueError: invalid literal for int() with base 10: 'abc'
+
+        Parsed versions are cached, so parsing the same string again hands out the same instance:
+
+        >>> Version.from_string("2023.03.05") is Version.from_string("2023.03.05")
+        True
+
+        Workloads parsing many unique strings can inspect and drop the cache:
+
+        >>> Version.from_string.cache_clear()
+        >>> Version.from_string.cache_info().currsize
+        0
         """
-        parts: list = [int(v) for v in version.split(".")]
-        return Version(*parts)
+        parts: Tuple[int, ...] = tuple(map(int, version.split(".")))
+        return Version._from_parts(parts)
 
     def __iter__(self) -> Iterator[int]:
         """Iterate through version parts, used for casting into list, tuple, etc...
@@ -121,8 +215,7 @@ class Version:
         >>> version_parts
         (2023, 3, 5)
         """
-        for part in self.__version_parts:
-            yield part
+        return iter(self.__version_parts)
 
     def __len__(self) -> int:
         """Returns number of version items
@@ -143,8 +236,17 @@ class Version:
         >>> vs = Version.from_string("2023.03.05")
         >>> str(vs), str(v)
         ('2023.3.5', '2023.3.5')
+
+        Representation is built once and then reused:
+
+        >>> str(v) is str(v)
+        True
         """
-        return ".".join([str(p) for p in self.__version_parts])
+        try:
+            return self._str_cache
+        except AttributeError:
+            self._str_cache = ".".join(map(str, self.__version_parts))
+            return self._str_cache
 
     def __eq__(self, b: object) -> bool:
         """Implementation of "==" internal type method for comparing values of same type
@@ -164,14 +266,50 @@ class Version:
         False
         >>> version_short == version_base
         False
+        >>> version_base == version_base
+        True
         """
-        if not isinstance(b, type(self)):
+        if self is b:
+            return True
+        if not isinstance(b, Version):
             return NotImplemented
 
-        self_parts: tuple = self.__version_parts
-        b_parts: tuple = tuple(b)  # type: ignore
+        return self.__version_parts == b.__version_parts
 
-        return self_parts == b_parts
+    def __hash__(self) -> int:
+        """Hash of the version, consistent with "==", so versions can be used in sets and as dictionary keys
+
+        >>> hash(Version(2023, 3, 5)) == hash(Version.from_string("2023.03.05"))
+        True
+        >>> len({Version(1, 0, 0), Version.from_string("1.0.0"), Version(1, 0, 0, 0)})
+        2
+
+        Cached hash is not serialized, unpickled or copied versions compute their own:
+
+        >>> import copy, pickle
+        >>> v = Version(2023, 3, 5)
+        >>> _ = hash(v), str(v), repr(v)
+        >>> for w in (pickle.loads(pickle.dumps(v)), copy.copy(v)):
+        ...     print(hasattr(w, "_hash_cache"), w == v, hash(w) == hash(v))
+        False True True
+        False True True
+
+        Same holds for subclasses, whose instance `__dict__` is carried over but not the caches:
+
+        >>> class TaggedVersion(Version):
+        ...     pass
+        >>> t = TaggedVersion(2023, 3, 5)
+        >>> t.tag = "x"
+        >>> _ = hash(t), str(t)
+        >>> w = copy.deepcopy(t)
+        >>> type(w).__name__, w.tag, hasattr(w, "_hash_cache"), hash(w) == hash(t)
+        ('TaggedVersion', 'x', False, True)
+        """
+        try:
+            return self._hash_cache
+        except AttributeError:
+            self._hash_cache = hash(self.__version_parts)
+            return self._hash_cache
 
     def __gt__(self, b: object) -> bool:
         """Implementation of ">" internal type method for comparing values of same type
@@ -197,14 +335,15 @@ class Version:
         TypeError: '>' not supported between instances of 'Version' and 'int'
         >>> version_short > version_base
         False
+        >>> version_base > version_base
+        False
         """
-        if not isinstance(b, type(self)):
+        if self is b:
+            return False
+        if not isinstance(b, Version):
             return NotImplemented
 
-        self_parts: tuple = self.__version_parts
-        b_parts: tuple = tuple(b)  # type: ignore
-
-        return self_parts > b_parts
+        return self.__version_parts > b.__version_parts
 
     def __lt__(self, b: object) -> bool:
         """Implementation of "<" internal type method for comparing values of same type
@@ -230,14 +369,15 @@ class Version:
         TypeError: '<' not supported between instances of 'Version' and 'int'
         >>> version_short < version_base
         True
+        >>> version_base < version_base
+        False
         """
-        if not isinstance(b, type(self)):
+        if self is b:
+            return False
+        if not isinstance(b, Version):
             return NotImplemented
 
-        self_parts: tuple = self.__version_parts
-        b_parts: tuple = tuple(b)  # type: ignore
-
-        return self_parts < b_parts
+        return self.__version_parts < b.__version_parts
 
     def __ge__(self, b: object) -> bool:
         """Implementation of ">=" internal type method for comparing values of same type
@@ -263,14 +403,15 @@ class Version:
         TypeError: '>=' not supported between instances of 'Version' and 'int'
         >>> version_short >= version_base
         False
+        >>> version_base >= version_base
+        True
         """
-        if not isinstance(b, type(self)):
+        if self is b:
+            return True
+        if not isinstance(b, Version):
             return NotImplemented
 
-        self_parts: tuple = self.__version_parts
-        b_parts: tuple = tuple(b)  # type: ignore
-
-        return self_parts > b_parts or self_parts == b_parts
+        return self.__version_parts >= b.__version_parts
 
     def __le__(self, b: object) -> bool:
         """Implementation of "<=" internal type method for comparing values of same type
@@ -296,14 +437,15 @@ class Version:
         TypeError: '<=' not supported between instances of 'Version' and 'int'
         >>> version_short <= version_base
         True
+        >>> version_base <= version_base
+        True
         """
-        if not isinstance(b, type(self)):
+        if self is b:
+            return True
+        if not isinstance(b, Version):
             return NotImplemented
 
-        self_parts: tuple = self.__version_parts
-        b_parts: tuple = tuple(b)  # type: ignore
-
-        return self_parts < b_parts or self_parts == b_parts
+        return self.__version_parts <= b.__version_parts
 
     def __repr__(self) -> str:
         """Representation internal method
@@ -311,8 +453,14 @@ class Version:
         >>> v = Version.from_string("1.0.0.5322")
         >>> v
         Version(1, 0, 0, 5322)
+        >>> repr(v) is repr(v)
+        True
         """
-        return f"Version{self.__version_parts}"
+        try:
+            return self._repr_cache
+        except AttributeError:
+            self._repr_cache = f"Version{self.__version_parts}"
+            return self._repr_cache
 
     def __getitem__(self, key: Union[int, slice]) -> Union[int, Tuple[int, ...]]:
         """Getitem internal method
@@ -350,6 +498,28 @@ class Version:
         return self.__version_parts[key]
 
 
+def sort_versions(versions: Iterable[Version], reverse: bool = False) -> List[Version]:
+    """Sort versions by their parts directly, same order as `sorted()` but without calling
+    comparison methods for every pair
+
+    >>> sort_versions([
+    ...     Version.from_string("1.0.0"), Version.from_string("1.0.1"),
+    ...     Version.from_string("0.9.95"), Version(0, 8, 97),
+    ...     Version(2024, 2, 25, 101), Version(1, 0, 0, 0)])
+    [Version(0, 8, 97), Version(0, 9, 95), Version(1, 0, 0), Version(1, 0, 0, 0), Version(1, 0, 1), Version(2024, 2, 25, 101)]
+    >>> sort_versions([Version(1, 2), Version(-3, 5), Version(1, 2, 0)], reverse=True)
+    [Version(1, 2, 0), Version(1, 2), Version(-3, 5)]
+
+    Unlike `sorted()`, anything that is not a `Version` fails on reading its parts:
+
+    >>> sort_versions([Version(1, 2), 3])  # doctest: +ELLIPSIS
+    Traceback (most recent call last):
+    ...
+    AttributeError: 'int' object has no attribute ...
+    """
+    return sorted(versions, key=Version._parts_key, reverse=reverse)
+
+
 if __name__ == "__main__":
     """
     Execute this file directly to run all the `doctest`s